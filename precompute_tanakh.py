@@ -26,40 +26,93 @@ Usage::
                                 --out-dir dataset
 
 If the input directory contains multiple JSON files, the script will
-process each of them.  If you want to process a single file you can
-use ``--input-file`` instead of ``--input-dir``.
+process each of them, in parallel across worker processes.  If you want
+to process a single file you can use ``--input-file`` instead of
+``--input-dir``.
+
+Books whose input and precompute code are unchanged since the last run are
+skipped (see ``.cache_key`` in each book directory); pass ``--force`` to
+recompute them anyway.
+
+JSON is read and written with ``orjson`` (``pip install orjson``).
 """
 
-import json
 import os
-import re
 import argparse
-from typing import Dict, List
+import hashlib
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Tuple
+
+import orjson
+
+import torahcalc_methods
+from torahcalc_methods import ADDITIVE_METHODS, compute_all, _strip_non_hebrew
 
-from torahcalc_methods import ADDITIVE_METHODS, DEFAULT_LETTER_NAMES
+# Translation tables for ``str.translate``.  Vowel points and cantillation
+# marks (U+0591..U+05C7) are deleted; for tokenisation sof pasuq (U+05C3) is
+# deleted and maqaf (U+05BE) becomes a word separator.
+_DIACRITIC_TABLE = dict.fromkeys(range(0x0591, 0x05C8), None)
+_TOKEN_TABLE = {0x05C3: None, 0x05BE: ' '}
 
 
 def remove_diacritics(s: str) -> str:
     """Remove Hebrew vowel points and cantillation marks from a string."""
-    return re.sub(r'[\u0591-\u05C7]', '', s)
+    return s.translate(_DIACRITIC_TABLE)
 
 
 def letters_only(s: str) -> str:
     """Remove all non‑Hebrew letters from a string."""
-    return ''.join(c for c in s if '\u05d0' <= c <= '\u05ea')
+    return _strip_non_hebrew(s)
 
 
 def tokenize(verse: str) -> List[str]:
     """Split a verse into tokens on whitespace and maqaf (U+05BE)."""
-    verse = verse.replace('\u05c3', '')  # remove sof pasuq
-    words = re.split(r'[\s\u05be]+', verse.strip())
-    return [w for w in words if w]
+    # split() with no arguments collapses whitespace runs and drops empties
+    return verse.translate(_TOKEN_TABLE).split()
+
+
+def clean_verse(verse: str) -> Tuple[List[str], str]:
+    """Split a verse into letters‑only tokens and the letters‑only verse text.
+
+    Gives the same result as applying ``letters_only`` to the verse and to
+    each token of ``tokenize`` after ``remove_diacritics``, but with a single
+    diacritic pass and no separate pass for the verse letters.
+    Maqaf and sof pasuq lie inside the diacritic range, so as with
+    remove_diacritics they are deleted and maqaf‑joined words stay one token.
+    """
+    tokens = [_strip_non_hebrew(tok) for tok in verse.translate(_DIACRITIC_TABLE).split()]
+    # Splitting only drops whitespace, so the tokens concatenate to the
+    # letters of the whole verse.
+    return tokens, ''.join(tokens)
 
 
-def precompute_book(book_json_path: str, out_root: str) -> None:
-    """Precompute gematria values for a single Sefaria book JSON file."""
-    with open(book_json_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+def _write_chapter(out_path: str, payload: bytes) -> None:
+    """Write one serialised chapter file."""
+    with open(out_path, 'wb') as f_out:
+        f_out.write(payload)
+    print(f"Wrote {out_path}")
+
+
+def _cache_key(book_bytes: bytes) -> str:
+    """Hash the input book together with the code that produces the output."""
+    digest = hashlib.sha1(book_bytes)
+    for source in (__file__, torahcalc_methods.__file__):
+        with open(source, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def precompute_book(book_json_path: str, out_root: str, force: bool = False) -> None:
+    """Precompute gematria values for a single Sefaria book JSON file.
+
+    A ``.cache_key`` file in the book's output directory records a hash of the
+    input and of the precompute code; if it matches, the book is skipped
+    unless ``force`` is set.
+    """
+    with open(book_json_path, 'rb') as f:
+        book_bytes = f.read()
+    data = orjson.loads(book_bytes)
 
     title = data.get('title', os.path.basename(book_json_path).split('.')[0])
     text = data.get('text')
@@ -69,45 +122,72 @@ def precompute_book(book_json_path: str, out_root: str) -> None:
     book_out_dir = os.path.join(out_root, title)
     os.makedirs(book_out_dir, exist_ok=True)
 
-    for chapter_idx, verses in enumerate(text, start=1):
-        chapter_data: Dict[str, Dict] = {}
-        for verse_idx, verse in enumerate(verses, start=1):
-            original = verse
-            # Remove diacritics (if any) and obtain letters‑only string
-            cleaned = remove_diacritics(verse)
-            letters = letters_only(cleaned)
-            tokens = tokenize(cleaned)
-
-            token_entries: List[Dict] = []
-            token_totals: Dict[str, int] = {method: 0 for method in ADDITIVE_METHODS.keys()}
-
-            for tok in tokens:
-                letters_tok = letters_only(tok)
-                values: Dict[str, int] = {}
-                for method_name, func in ADDITIVE_METHODS.items():
-                    if method_name in {'shemi', 'neelam', 'ofanim'}:
-                        # Use default letter names for Milui‑dependent methods
-                        values[method_name] = func(letters_tok, DEFAULT_LETTER_NAMES)
-                    else:
-                        values[method_name] = func(letters_tok)
-                    token_totals[method_name] += values[method_name]
-                token_entries.append({'t': letters_tok, 'v': values})
-
-            verse_key = str(verse_idx)
-            chapter_data[verse_key] = {
-                'text': original,
-                'text_letters': letters,
-                'tokens': [te['t'] for te in token_entries],
-                'values': {
-                    'sum_of_tokens': token_totals,
-                    'tokens': token_entries,
+    key = _cache_key(book_bytes)
+    key_path = os.path.join(book_out_dir, '.cache_key')
+    if not force and os.path.exists(key_path):
+        with open(key_path, 'r', encoding='utf-8') as f:
+            if f.read().strip() == key:
+                print(f"Skipping {title}: output is up to date")
+                return
+
+    # Token values depend only on the letters, and common words recur
+    # thousands of times per book, so compute each distinct token once.
+    token_cache: Dict[str, Dict[str, int]] = {}
+    # Bind the lookup once so the attribute access stays out of the token loop.
+    cached_values = token_cache.get
+
+    # Chapter files are written on background threads so disk I/O overlaps
+    # with computing the next chapter.
+    with ThreadPoolExecutor(max_workers=2) as writer:
+        writes = []
+        for chapter_idx, verses in enumerate(text, start=1):
+            chapter_data: Dict[str, Dict] = {}
+            for verse_idx, verse in enumerate(verses, start=1):
+                original = verse
+                # Remove diacritics (if any) and obtain letters‑only strings
+                tokens, letters = clean_verse(verse)
+
+                token_entries: List[Dict] = []
+
+                for letters_tok in tokens:
+                    values = cached_values(letters_tok)
+                    if values is None:
+                        # Milui‑dependent methods use the default letter names
+                        values = compute_all(letters_tok)
+                        token_cache[letters_tok] = values
+                    token_entries.append({'t': letters_tok, 'v': values})
+
+                # Sum the token values column‑wise in one pass rather than
+                # updating the totals dict once per method per token.  Token
+                # values share the key order of ADDITIVE_METHODS (see compute_all).
+                if token_entries:
+                    columns = zip(*[te['v'].values() for te in token_entries])
+                    token_totals = dict(zip(ADDITIVE_METHODS, map(sum, columns)))
+                else:
+                    token_totals = dict.fromkeys(ADDITIVE_METHODS, 0)
+
+                verse_key = str(verse_idx)
+                chapter_data[verse_key] = {
+                    'text': original,
+                    'text_letters': letters,
+                    'tokens': [te['t'] for te in token_entries],
+                    'values': {
+                        'sum_of_tokens': token_totals,
+                        'tokens': token_entries,
+                    }
                 }
-            }
 
-        out_path = os.path.join(book_out_dir, f"{chapter_idx}.json")
-        with open(out_path, 'w', encoding='utf-8') as f_out:
-            json.dump({title: {str(chapter_idx): chapter_data}}, f_out, ensure_ascii=False, indent=2)
-        print(f"Wrote {out_path}")
+            out_path = os.path.join(book_out_dir, f"{chapter_idx}.json")
+            payload = orjson.dumps({title: {str(chapter_idx): chapter_data}}, option=orjson.OPT_INDENT_2)
+            writes.append(writer.submit(_write_chapter, out_path, payload))
+
+        # Surface any error raised while writing
+        for future in writes:
+            future.result()
+
+    # Only record the key once every chapter has been written
+    with open(key_path, 'w', encoding='utf-8') as f:
+        f.write(key)
 
 
 def main() -> None:
@@ -116,14 +196,20 @@ def main() -> None:
     group.add_argument('--input-dir', help='Directory containing one or more Sefaria book JSON files')
     group.add_argument('--input-file', help='Path to a single Sefaria book JSON file')
     parser.add_argument('--out-dir', required=True, help='Output root directory for dataset (per book subdirs)')
+    parser.add_argument('--force', action='store_true', help='Recompute books even if their output is up to date')
     args = parser.parse_args()
 
     if args.input_file:
-        precompute_book(args.input_file, args.out_dir)
+        precompute_book(args.input_file, args.out_dir, args.force)
     else:
-        for fname in os.listdir(args.input_dir):
-            if fname.lower().endswith('.json'):
-                precompute_book(os.path.join(args.input_dir, fname), args.out_dir)
+        paths = [os.path.join(args.input_dir, fname)
+                 for fname in os.listdir(args.input_dir)
+                 if fname.lower().endswith('.json')]
+        if not paths:
+            return
+        # Books are independent, so process them in parallel, one per worker.
+        with multiprocessing.Pool(min(len(paths), os.cpu_count() or 1)) as pool:
+            pool.starmap(precompute_book, [(path, args.out_dir, args.force) for path in paths])
 
 
 if __name__ == '__main__':
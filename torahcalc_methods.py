@@ -20,7 +20,6 @@ ignore any non‑Hebrew characters.  Final forms are normalised to their
 base forms for the purposes of the value lookup.
 """
 
-import re
 from typing import Dict, List
 
 # -----------------------------------------------------------------------------
@@ -109,78 +108,154 @@ for ch in _ORDERED_LETTERS:
     _running += _HECHRACHI[ch]
     _CUM_SUM_HECHRACHI[ch] = _running
 
+# Final forms and their base letters, used where finals are normalised.
+_FINAL_TO_BASE: Dict[str, str] = {'ך': 'כ', 'ם': 'מ', 'ן': 'נ', 'ף': 'פ', 'ץ': 'צ'}
+
+class _LettersOnlyTable(dict):
+    """Translation table that keeps Hebrew letters (U+05D0..U+05EA, which
+    includes the finals) and deletes everything else.  Entries are filled in
+    on first lookup, so the table only holds the code points actually seen."""
+
+    def __missing__(self, code: int):
+        value = code if 0x05D0 <= code <= 0x05EA else None
+        self[code] = value
+        return value
+
+_LETTERS_ONLY_TABLE = _LettersOnlyTable()
+
 def _strip_non_hebrew(s: str) -> str:
     """Remove all non‑Hebrew letters from the input string."""
-    return ''.join(c for c in s if c in _HECHRACHI)
-
-def _apply_table(s: str, table: Dict[str, int]) -> int:
-    """Sum values from a table for the letters of a string, ignoring missing keys."""
-    total = 0
-    for c in s:
-        total += table.get(c, 0)
-    return total
+    return s.translate(_LETTERS_ONLY_TABLE)
+
+# Indexed lookup tables.  The 27 Hebrew letters (including finals) occupy the
+# contiguous code points U+05D0..U+05EA, so after _strip_non_hebrew each
+# letter's value can be fetched from a list at index ord(c) - _LETTER_BASE
+# instead of a dict lookup.
+_LETTER_BASE = 0x05D0
+_NUM_LETTERS = 27
+
+def _to_array(table: Dict[str, int]) -> List[int]:
+    """Convert a per‑letter dict into a list indexed by ord(c) - _LETTER_BASE."""
+    return [table.get(chr(_LETTER_BASE + i), 0) for i in range(_NUM_LETTERS)]
+
+_HECHRACHI_A = _to_array(_HECHRACHI)
+_GADOL_A = _to_array(_GADOL)
+_SIDURI_A = _to_array(_SIDURI)
+_KATAN_A = _to_array(_KATAN)
+_MISPARI_A = _to_array(_MISPARI)
+_PERATI_A = [v ** 2 for v in _HECHRACHI_A]
+_MESHULASH_A = [v ** 3 for v in _HECHRACHI_A]
+# Final forms take the cumulative sum of their base letter.
+_KIDMI_A = _to_array({c: _CUM_SUM_HECHRACHI[_FINAL_TO_BASE.get(c, c)] for c in _HECHRACHI})
+
+# Byte tables for bytes.translate.  Every Hebrew letter is U+05xx, so the low
+# byte of its UTF‑16 code unit identifies it.  Translating those low bytes
+# through a 256‑entry table maps a whole string in one C‑level pass.
+def _to_byte_table(table: List[int]) -> bytes:
+    """Convert an indexed table with values < 256 into a bytes.translate table."""
+    out = bytearray(256)
+    for i, v in enumerate(table):
+        out[(_LETTER_BASE + i) & 0xFF] = v
+    return bytes(out)
+
+# Siduri and Katan values all fit in a byte and are summed directly from the
+# translated bytes; _INDEX_B yields the index into the list tables instead.
+_SIDURI_B = _to_byte_table(_SIDURI_A)
+_KATAN_B = _to_byte_table(_KATAN_A)
+_INDEX_B = _to_byte_table(list(range(_NUM_LETTERS)))
+
+def _letter_indices(s: str) -> bytes:
+    """Return the table indices of a string of Hebrew letters only, as bytes.
+
+    Iterating the result yields small cached ints, which is cheaper than
+    building a one‑character string and calling ord() for every letter."""
+    return s.encode('utf-16-le')[::2].translate(_INDEX_B)
+
+def _apply_table(s: str, table: List[int]) -> int:
+    """Sum values from an indexed table for a string of Hebrew letters only."""
+    return sum(table[i] for i in _letter_indices(s))
+
+def _apply_byte_table(s: str, table: bytes) -> int:
+    """Sum values from a byte table for a string of Hebrew letters only."""
+    return sum(s.encode('utf-16-le')[::2].translate(table))
 
 # -----------------------------------------------------------------------------
 # Public methods
 # -----------------------------------------------------------------------------
 
+# Each public method strips its input and delegates to an underscore variant
+# that expects a string of Hebrew letters only.  Callers that have already
+# reduced their input to letters (e.g. precompute_tanakh) can use the
+# variants in _PRE_METHODS directly and skip the redundant strip.
+
+def _mispar_hechrachi(s: str) -> int:
+    return _apply_table(s, _HECHRACHI_A)
+
+def _mispar_gadol(s: str) -> int:
+    return _apply_table(s, _GADOL_A)
+
+def _mispar_siduri(s: str) -> int:
+    return _apply_byte_table(s, _SIDURI_B)
+
+def _mispar_katan(s: str) -> int:
+    return _apply_byte_table(s, _KATAN_B)
+
+def _mispar_perati(s: str) -> int:
+    return _apply_table(s, _PERATI_A)
+
+def _mispar_meshulash(s: str) -> int:
+    return _apply_table(s, _MESHULASH_A)
+
+def _mispar_kidmi(s: str) -> int:
+    return _apply_table(s, _KIDMI_A)
+
+def _mispar_boneh(s: str) -> int:
+    total = 0
+    running = 0
+    for i in _letter_indices(s):
+        running += _HECHRACHI_A[i]
+        total += running
+    return total
+
+def _mispar_mispari(s: str) -> int:
+    return _apply_table(s, _MISPARI_A)
+
 def mispar_hechrachi(s: str) -> int:
     """Standard gematria (Mispar Hechrachi)."""
-    return _apply_table(_strip_non_hebrew(s), _HECHRACHI)
+    return _mispar_hechrachi(_strip_non_hebrew(s))
 
 def mispar_gadol(s: str) -> int:
     """Large sofit values for final letters."""
-    return _apply_table(_strip_non_hebrew(s), _GADOL)
+    return _mispar_gadol(_strip_non_hebrew(s))
 
 def mispar_siduri(s: str) -> int:
     """Ordinal values 1..22."""
-    return _apply_table(_strip_non_hebrew(s), _SIDURI)
+    return _mispar_siduri(_strip_non_hebrew(s))
 
 def mispar_katan(s: str) -> int:
     """Reduced values (mod 9 with 0→9)."""
-    return _apply_table(_strip_non_hebrew(s), _KATAN)
+    return _mispar_katan(_strip_non_hebrew(s))
 
 def mispar_perati(s: str) -> int:
     """HaMerubah HaPerati – sum of squares of Hechrachi values."""
-    s = _strip_non_hebrew(s)
-    return sum(_HECHRACHI[c] ** 2 for c in s)
+    return _mispar_perati(_strip_non_hebrew(s))
 
 def mispar_meshulash(s: str) -> int:
     """Mispar Meshulash – sum of cubes of Hechrachi values."""
-    s = _strip_non_hebrew(s)
-    return sum(_HECHRACHI[c] ** 3 for c in s)
+    return _mispar_meshulash(_strip_non_hebrew(s))
 
 def mispar_kidmi(s: str) -> int:
-    """Mispar Kidmi – cumulative sums of standard values up to each letter."""
-    total = 0
-    for c in _strip_non_hebrew(s):
-        base = c
-        # treat final forms as their base character for cumulative sum
-        if c in {'ך','כ'}:
-            base = 'כ'
-        elif c in {'ם','מ'}:
-            base = 'מ'
-        elif c in {'ן','נ'}:
-            base = 'נ'
-        elif c in {'ף','פ'}:
-            base = 'פ'
-        elif c in {'ץ','צ'}:
-            base = 'צ'
-        total += _CUM_SUM_HECHRACHI.get(base, 0)
-    return total
+    """Mispar Kidmi – cumulative sums of standard values up to each letter.
+    Final forms count as their base character."""
+    return _mispar_kidmi(_strip_non_hebrew(s))
 
 def mispar_boneh(s: str) -> int:
     """Mispar Bone'eh – cumulative sum within a word (building)."""
-    total = 0
-    running = 0
-    for c in _strip_non_hebrew(s):
-        running += _HECHRACHI.get(c, 0)
-        total += running
-    return total
+    return _mispar_boneh(_strip_non_hebrew(s))
 
 def mispar_mispari(s: str) -> int:
     """Mispar Mispari – per‑letter values from the spelled number names table."""
-    return _apply_table(_strip_non_hebrew(s), _MISPARI)
+    return _mispar_mispari(_strip_non_hebrew(s))
 
 # -----------------------------------------------------------------------------
 # Letter substitutions (temurot)
@@ -268,29 +343,60 @@ def _transform(s: str, mapping: Dict[str, str]) -> str:
     """Apply a letter substitution mapping to a string of Hebrew letters."""
     out = []
     for c in s:
-        base = c
         # normalise finals to their base for mapping
-        if c in {'ך','כ'}:
-            base = 'כ'
-        elif c in {'ם','מ'}:
-            base = 'מ'
-        elif c in {'ן','נ'}:
-            base = 'נ'
-        elif c in {'ף','פ'}:
-            base = 'פ'
-        elif c in {'ץ','צ'}:
-            base = 'צ'
+        base = _FINAL_TO_BASE.get(c, c)
         out.append(mapping.get(base, base))
     return ''.join(out)
 
+def _temurah_array(mapping: Dict[str, str], table: Dict[str, int]) -> List[int]:
+    """Fuse a substitution with a value table: entry i is the value of the
+    letter that chr(_LETTER_BASE + i) is transformed into."""
+    return [table[_transform(chr(_LETTER_BASE + i), mapping)] for i in range(_NUM_LETTERS)]
+
+# Temurah value tables.  AtBach and Ayak Bachar are valued with Gadol so that
+# final letters in the result take their large sofit values; the others use
+# Hechrachi.
+_ATBASH_A = _temurah_array(_ATBASH_MAP, _HECHRACHI)
+_ALBAM_A = _temurah_array(_ALBAM_MAP, _HECHRACHI)
+_ACHBI_A = _temurah_array(_ACHBI_MAP, _HECHRACHI)
+_ATBACH_A = _temurah_array(_ATBACH_MAP, _GADOL)
+_AYAK_A = _temurah_array(_AYAK_MAP, _GADOL)
+_ACHAS_BETA_A = _temurah_array(_ACHAS_BETA_MAP, _HECHRACHI)
+_AVGAD_A = _temurah_array(_AVGAD_MAP, _HECHRACHI)
+_REV_AVGAD_A = _temurah_array(_REV_AVGAD_MAP, _HECHRACHI)
+
+def _atbash_value(s: str) -> int:
+    return _apply_table(s, _ATBASH_A)
+
+def _albam_value(s: str) -> int:
+    return _apply_table(s, _ALBAM_A)
+
+def _achbi_value(s: str) -> int:
+    return _apply_table(s, _ACHBI_A)
+
+def _atbach_value(s: str) -> int:
+    return _apply_table(s, _ATBACH_A)
+
+def _ayak_bachar_value(s: str) -> int:
+    return _apply_table(s, _AYAK_A)
+
+def _achas_beta_value(s: str) -> int:
+    return _apply_table(s, _ACHAS_BETA_A)
+
+def _avgad_value(s: str) -> int:
+    return _apply_table(s, _AVGAD_A)
+
+def _reverse_avgad_value(s: str) -> int:
+    return _apply_table(s, _REV_AVGAD_A)
+
 def atbash_value(s: str) -> int:
-    return mispar_hechrachi(_transform(_strip_non_hebrew(s), _ATBASH_MAP))
+    return _atbash_value(_strip_non_hebrew(s))
 
 def albam_value(s: str) -> int:
-    return mispar_hechrachi(_transform(_strip_non_hebrew(s), _ALBAM_MAP))
+    return _albam_value(_strip_non_hebrew(s))
 
 def achbi_value(s: str) -> int:
-    return mispar_hechrachi(_transform(_strip_non_hebrew(s), _ACHBI_MAP))
+    return _achbi_value(_strip_non_hebrew(s))
 
 def atbach_value(s: str) -> int:
     """
@@ -302,9 +408,7 @@ def atbach_value(s: str) -> int:
     elevated values (e.g. ף=800).  This matches TorahCalc where
     "בראשית" yields 2207.
     """
-    transformed = _transform(_strip_non_hebrew(s), _ATBACH_MAP)
-    # Use mispar_gadol to assign large values to any final letters in the result
-    return mispar_gadol(transformed)
+    return _atbach_value(_strip_non_hebrew(s))
 
 def ayak_bachar_value(s: str) -> int:
     """
@@ -315,55 +419,81 @@ def ayak_bachar_value(s: str) -> int:
     their large sofit values.  This produces, for example, 139 for
     "בראשית".
     """
-    transformed = _transform(_strip_non_hebrew(s), _AYAK_MAP)
-    return mispar_gadol(transformed)
+    return _ayak_bachar_value(_strip_non_hebrew(s))
 
 def achas_beta_value(s: str) -> int:
-    return mispar_hechrachi(_transform(_strip_non_hebrew(s), _ACHAS_BETA_MAP))
+    return _achas_beta_value(_strip_non_hebrew(s))
 
 def avgad_value(s: str) -> int:
-    return mispar_hechrachi(_transform(_strip_non_hebrew(s), _AVGAD_MAP))
+    return _avgad_value(_strip_non_hebrew(s))
 
 def reverse_avgad_value(s: str) -> int:
-    return mispar_hechrachi(_transform(_strip_non_hebrew(s), _REV_AVGAD_MAP))
+    return _reverse_avgad_value(_strip_non_hebrew(s))
 
 # -----------------------------------------------------------------------------
 # Milui‑dependent methods
 # -----------------------------------------------------------------------------
 
-def mispar_shemi(s: str, letter_names: Dict[str, str] = None) -> int:
-    """Mispar Shemi (Milui) – sum of Hechrachi values of letter names."""
-    if letter_names is None:
-        letter_names = DEFAULT_LETTER_NAMES
+# Letter names may be supplied by the UI with arbitrary spellings, so the
+# names themselves are still valued with the stripping mispar_hechrachi.
+
+def _shemi_from_names(s: str, letter_names: Dict[str, str]) -> int:
     total = 0
-    for c in _strip_non_hebrew(s):
+    for c in s:
         name = letter_names.get(c, '')
         total += mispar_hechrachi(name)
     return total
 
-def mispar_neelam(s: str, letter_names: Dict[str, str] = None) -> int:
-    """Mispar Ne'elam – sum of Hechrachi values of the hidden parts of the
-    letter names (i.e. letter names without the first letter)."""
-    if letter_names is None:
-        letter_names = DEFAULT_LETTER_NAMES
+def _neelam_from_names(s: str, letter_names: Dict[str, str]) -> int:
     total = 0
-    for c in _strip_non_hebrew(s):
+    for c in s:
         name = letter_names.get(c, '')
         hidden = name[1:] if len(name) > 1 else ''
         total += mispar_hechrachi(hidden)
     return total
 
-def ofanim_value(s: str, letter_names: Dict[str, str] = None) -> int:
-    """Ofanim – sum of Hechrachi values of the final letter of each letter name."""
-    if letter_names is None:
-        letter_names = DEFAULT_LETTER_NAMES
+def _ofanim_from_names(s: str, letter_names: Dict[str, str]) -> int:
     total = 0
-    for c in _strip_non_hebrew(s):
+    for c in s:
         name = letter_names.get(c, '')
         if name:
             total += mispar_hechrachi(name[-1])
     return total
 
+# With the default spellings each letter's contribution is a constant, so
+# compute it once per letter and reduce the common case to a table lookup.
+_SHEMI_A = [_shemi_from_names(chr(_LETTER_BASE + i), DEFAULT_LETTER_NAMES) for i in range(_NUM_LETTERS)]
+_NEELAM_A = [_neelam_from_names(chr(_LETTER_BASE + i), DEFAULT_LETTER_NAMES) for i in range(_NUM_LETTERS)]
+_OFANIM_A = [_ofanim_from_names(chr(_LETTER_BASE + i), DEFAULT_LETTER_NAMES) for i in range(_NUM_LETTERS)]
+
+def _mispar_shemi(s: str, letter_names: Dict[str, str] = None) -> int:
+    if letter_names is None or letter_names is DEFAULT_LETTER_NAMES:
+        return _apply_table(s, _SHEMI_A)
+    return _shemi_from_names(s, letter_names)
+
+def _mispar_neelam(s: str, letter_names: Dict[str, str] = None) -> int:
+    if letter_names is None or letter_names is DEFAULT_LETTER_NAMES:
+        return _apply_table(s, _NEELAM_A)
+    return _neelam_from_names(s, letter_names)
+
+def _ofanim_value(s: str, letter_names: Dict[str, str] = None) -> int:
+    if letter_names is None or letter_names is DEFAULT_LETTER_NAMES:
+        return _apply_table(s, _OFANIM_A)
+    return _ofanim_from_names(s, letter_names)
+
+def mispar_shemi(s: str, letter_names: Dict[str, str] = None) -> int:
+    """Mispar Shemi (Milui) – sum of Hechrachi values of letter names."""
+    return _mispar_shemi(_strip_non_hebrew(s), letter_names)
+
+def mispar_neelam(s: str, letter_names: Dict[str, str] = None) -> int:
+    """Mispar Ne'elam – sum of Hechrachi values of the hidden parts of the
+    letter names (i.e. letter names without the first letter)."""
+    return _mispar_neelam(_strip_non_hebrew(s), letter_names)
+
+def ofanim_value(s: str, letter_names: Dict[str, str] = None) -> int:
+    """Ofanim – sum of Hechrachi values of the final letter of each letter name."""
+    return _ofanim_value(_strip_non_hebrew(s), letter_names)
+
 # Expose a list of all additive method functions for convenience.
 ADDITIVE_METHODS = {
     'hechrachi': mispar_hechrachi,
@@ -386,4 +516,84 @@ ADDITIVE_METHODS = {
     'achas_beta': achas_beta_value,
     'avgad': avgad_value,
     'reverse_avgad': reverse_avgad_value,
-}
\ No newline at end of file
+}
+
+# The same methods, taking strings that are already Hebrew letters only.
+_PRE_METHODS = {
+    'hechrachi': _mispar_hechrachi,
+    'gadol': _mispar_gadol,
+    'siduri': _mispar_siduri,
+    'katan': _mispar_katan,
+    'perati': _mispar_perati,
+    'meshulash': _mispar_meshulash,
+    'kidmi': _mispar_kidmi,
+    'boneh': _mispar_boneh,
+    'mispari': _mispar_mispari,
+    'shemi': _mispar_shemi,
+    'neelam': _mispar_neelam,
+    'ofanim': _ofanim_value,
+    'atbash': _atbash_value,
+    'albam': _albam_value,
+    'achbi': _achbi_value,
+    'atbach': _atbach_value,
+    'ayak_bachar': _ayak_bachar_value,
+    'achas_beta': _achas_beta_value,
+    'avgad': _avgad_value,
+    'reverse_avgad': _reverse_avgad_value,
+}
+# -----------------------------------------------------------------------------
+# Fused computation of all methods
+# -----------------------------------------------------------------------------
+
+# Every method except Bone'eh is a plain sum of per‑letter contributions, so
+# the contribution of each letter under each method is a constant.  Evaluate
+# the methods once per letter (Milui methods with the default letter names)
+# into one column of contributions per method, indexed like the _*_A tables.
+# Bone'eh depends on letter position and is accumulated separately.
+_METHOD_NAMES: List[str] = list(ADDITIVE_METHODS)
+_METHOD_COLUMNS: Dict[str, tuple] = {
+    name: tuple(_PRE_METHODS[name](chr(_LETTER_BASE + i)) for i in range(_NUM_LETTERS))
+    for name in _METHOD_NAMES if name != 'boneh'
+}
+
+def _gen_compute_all() -> str:
+    """Generate the source of compute_all.
+
+    The generated function walks the letter indices once, keeping one local
+    accumulator per method and indexing each method's column written out as
+    a tuple literal, so the loop body has no dict or global lookups::
+
+        def compute_all(letters):
+            v0 = v1 = ... = 0
+            running = boneh = 0
+            for i in _letter_indices(letters):
+                v0 += (1, 2, 3, ...)[i]
+                ...
+                running += (1, 2, 3, ...)[i]
+                boneh += running
+            return {'hechrachi': v0, ..., 'boneh': boneh, ...}
+    """
+    linear = [(k, name) for k, name in enumerate(_METHOD_NAMES) if name != 'boneh']
+    lines = [
+        'def compute_all(letters):',
+        '    ' + ' = '.join(f'v{k}' for k, _ in linear) + ' = 0',
+        '    running = boneh = 0',
+        '    for i in _letter_indices(letters):',
+    ]
+    for k, name in linear:
+        lines.append(f'        v{k} += {_METHOD_COLUMNS[name]!r}[i]')
+    lines.append(f'        running += {tuple(_HECHRACHI_A)!r}[i]')
+    lines.append('        boneh += running')
+    items = ', '.join(f"'{name}': boneh" if name == 'boneh' else f"'{name}': v{k}"
+                      for k, name in enumerate(_METHOD_NAMES))
+    lines.append(f'    return {{{items}}}')
+    return '\n'.join(lines) + '\n'
+
+exec(compile(_gen_compute_all(), '<compute_all>', 'exec'))
+compute_all.__doc__ = """Compute every method in ADDITIVE_METHODS for a string in one pass.
+
+    ``letters`` must already be reduced to Hebrew letters only (as done by
+    ``precompute_tanakh.letters_only``).  Milui methods use
+    DEFAULT_LETTER_NAMES.  The result has the same keys, in the same order,
+    as ADDITIVE_METHODS.  The function is generated by _gen_compute_all.
+    """